@@ -1,6 +1,7 @@
 import io
 import itertools
 import contextlib
+import copy
 import pathlib
 import tempfile
 import shutil
@@ -88,6 +89,17 @@ alpharep_generators = [
 pass_alpharep = parameterize(['alpharep'], alpharep_generators)
 
 
+class TaggedPath(zipp.Path):
+    """
+    A Path subclass keeping extra state (defined at module level
+    so it may be pickled).
+    """
+
+    def __init__(self, root, at="", tag='t'):
+        super().__init__(root, at)
+        self.tag = tag
+
+
 class TestPath(unittest.TestCase):
     def setUp(self):
         self.fixtures = contextlib.ExitStack()
@@ -317,6 +329,31 @@ class TestPath(unittest.TestCase):
         (baz,) = (root / 'bar').iterdir()
         assert baz.read_text(encoding="utf-8") == 'baz'
 
+    @pass_alpharep
+    def test_mutability_open_write(self, alpharep):
+        """
+        Entries written through an open handle should also be
+        reflected once the handle is closed.
+        """
+        root = zipp.Path(alpharep)
+        assert not (root / 'new' / 'file.txt').exists()
+        with alpharep.open('new/file.txt', 'w') as strm:
+            strm.write(b'new')
+        assert (root / 'new').is_dir()
+        (new,) = (root / 'new').iterdir()
+        assert new.read_text(encoding="utf-8") == 'new'
+
+    @pass_alpharep
+    def test_namelist_copy(self, alpharep):
+        """
+        Mutating the returned namelist should not affect the Path.
+        """
+        root = zipp.Path(alpharep)
+        alpharep.namelist().append('bogus/')
+        assert 'bogus/' not in alpharep.namelist()
+        assert not (root / 'bogus').exists()
+        assert not any(child.name == 'bogus' for child in root.iterdir())
+
     HUGE_ZIPFILE_NUM_ENTRIES = 2**13
 
     def huge_zipfile(self):
@@ -548,6 +585,22 @@ class TestPath(unittest.TestCase):
         file = cls(alpharep).joinpath('some dir').parent
         assert isinstance(file, cls)
 
+    @pass_alpharep
+    def test_inheritance_init_state(self, alpharep):
+        """
+        Derived paths should be constructed through the subclass __init__.
+        """
+
+        class Tagged(zipp.Path):
+            def __init__(self, root, at="", tag='t'):
+                super().__init__(root, at)
+                self.tag = tag
+
+        root = Tagged(alpharep)
+        assert (root / 'a.txt').tag == 't'
+        assert [child.tag for child in root.iterdir()] == ['t'] * 4
+        assert (root / 'b' / 'c.txt').parent.tag == 't'
+
     @parameterize(
         ['alpharep', 'path_type', 'subpath'],
         itertools.product(
@@ -564,6 +617,25 @@ class TestPath(unittest.TestCase):
         first, *rest = restored_1.iterdir()
         assert first.read_text(encoding='utf-8').startswith('content of ')
 
+    @pass_alpharep
+    def test_pickle_protocols(self, alpharep):
+        zipfile_ondisk = self.zipfile_ondisk(alpharep)
+        path = zipp.Path(zipfile_ondisk, at='b/')
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            restored = pickle.loads(pickle.dumps(path, protocol))
+            assert restored.at == 'b/'
+            assert (restored / 'c.txt').read_text(encoding='utf-8') == 'content of c'
+
+    @pass_alpharep
+    def test_pickle_subclass_state(self, alpharep):
+        zipfile_ondisk = self.zipfile_ondisk(alpharep)
+        path = TaggedPath(zipfile_ondisk, at='b/', tag='x')
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            restored = pickle.loads(pickle.dumps(path, protocol))
+            assert (restored.at, restored.tag) == ('b/', 'x')
+        copied = copy.copy(path)
+        assert (copied.root, copied.at, copied.tag) == (path.root, 'b/', 'x')
+
     @pass_alpharep
     def test_extract_orig_with_implied_dirs(self, alpharep):
         """
@@ -13,49 +13,28 @@ from .glob import translate
 __all__ = ['Path']
 
 
-def _parents(path):
+def _unique_parents(names):
     """
-    Given a path with elements separated by
-    posixpath.sep, generate all parents of that path.
-
-    >>> list(_parents('b/d'))
-    ['b']
-    >>> list(_parents('/b/d/'))
-    ['/b']
-    >>> list(_parents('b/d/f/'))
-    ['b/d', 'b']
-    >>> list(_parents('b'))
-    []
-    >>> list(_parents(''))
-    []
-    """
-    return itertools.islice(_ancestry(path), 1, None)
-
+    Given names with elements separated by posixpath.sep,
+    return each parent once, splitting each name only until
+    reaching a parent already seen (whose ancestors were seen too).
 
-def _ancestry(path):
-    """
-    Given a path with elements separated by
-    posixpath.sep, generate all elements of that path
-
-    >>> list(_ancestry('b/d'))
+    >>> _unique_parents(['b/d/e', 'b/d/f', 'b/c', 'g'])
     ['b/d', 'b']
-    >>> list(_ancestry('/b/d/'))
-    ['/b/d', '/b']
-    >>> list(_ancestry('b/d/f/'))
-    ['b/d/f', 'b/d', 'b']
-    >>> list(_ancestry('b'))
-    ['b']
-    >>> list(_ancestry(''))
+    >>> _unique_parents(['/b/d/', 'b/d/f/'])
+    ['/b', 'b/d', 'b']
+    >>> _unique_parents(['b', ''])
     []
     """
-    path = path.rstrip(posixpath.sep)
-    while path and path != posixpath.sep:
-        yield path
-        path, tail = posixpath.split(path)
-
-
-_dedupe = dict.fromkeys
-"""Deduplicate an iterable in original order"""
+    seen = set()
+    out = []
+    for name in names:
+        path = posixpath.dirname(name.rstrip(posixpath.sep))
+        while path and path != posixpath.sep and path not in seen:
+            seen.add(path)
+            out.append(path)
+            path = posixpath.dirname(path)
+    return out
 
 
 def _difference(minuend, subtrahend):
@@ -97,16 +76,53 @@ class CompleteDirs(InitializedState, zipfile.ZipFile):
 
     @staticmethod
     def _implied_dirs(names):
-        parents = itertools.chain.from_iterable(map(_parents, names))
-        as_dirs = (p + posixpath.sep for p in parents)
-        return _dedupe(_difference(as_dirs, names))
+        as_dirs = (p + posixpath.sep for p in _unique_parents(names))
+        return list(_difference(as_dirs, names))
 
     def namelist(self):
-        names = super().namelist()
-        return names + list(self._implied_dirs(names))
+        return list(self._names())
+
+    def _names(self):
+        """
+        Return the cached names (including implied dirs) as a tuple.
+        """
+        self.__refresh()
+        return self.__names
 
     def _name_set(self):
-        return set(self.namelist())
+        self.__refresh()
+        return self.__name_set
+
+    def __refresh(self):
+        """
+        Rebuild the cached names only when entries have been
+        added to the zipfile since they were last computed.
+        """
+        count = len(self.filelist)
+        with contextlib.suppress(AttributeError):
+            if self.__count == count:
+                return
+        names = super().namelist()
+        self.__names = tuple(names + self._implied_dirs(names))
+        self.__name_set = set(self.__names)
+        self.__count = count
+
+    def _children(self):
+        """
+        Return a mapping of each directory (without the trailing
+        slash) to the names immediately within it.
+        """
+        names = self._names()
+        with contextlib.suppress(AttributeError):
+            if self.__children_count == self.__count:
+                return self.__children
+        children = {}
+        for name in names:
+            parent = posixpath.dirname(name.rstrip(posixpath.sep))
+            children.setdefault(parent, []).append(name)
+        self.__children = children
+        self.__children_count = self.__count
+        return children
 
     def resolve_dir(self, name):
         """
@@ -114,9 +130,10 @@ class CompleteDirs(InitializedState, zipfile.ZipFile):
         as a directory (with the trailing slash).
         """
         names = self._name_set()
+        if name in names:
+            return name
         dirname = name + '/'
-        dir_match = name not in names and dirname in names
-        return dirname if dir_match else name
+        return dirname if dirname in names else name
 
     def getinfo(self, name):
         """
@@ -132,8 +149,9 @@ class CompleteDirs(InitializedState, zipfile.ZipFile):
     @classmethod
     def make(cls, source):
         """
-        Given a source (filename or zipfile), return an
-        appropriate CompleteDirs subclass.
+        Given a source (filename or zipfile), return a
+        CompleteDirs, changing the class of a supplied zipfile
+        in place.
         """
         if isinstance(source, CompleteDirs):
             return source
@@ -141,33 +159,10 @@ class CompleteDirs(InitializedState, zipfile.ZipFile):
         if not isinstance(source, zipfile.ZipFile):
             return cls(source)
 
-        # Only allow for FastLookup when supplied zipfile is read-only
-        if 'r' not in source.mode:
-            cls = CompleteDirs
-
         source.__class__ = cls
         return source
 
 
-class FastLookup(CompleteDirs):
-    """
-    ZipFile subclass to ensure implicit
-    dirs exist and are resolved rapidly.
-    """
-
-    def namelist(self):
-        with contextlib.suppress(AttributeError):
-            return self.__names
-        self.__names = super().namelist()
-        return self.__names
-
-    def _name_set(self):
-        with contextlib.suppress(AttributeError):
-            return self.__lookup
-        self.__lookup = super()._name_set()
-        return self.__lookup
-
-
 def _extract_text_encoding(encoding=None, *args, **kwargs):
     # stacklevel=3 so that the caller of the caller see any warning.
     return text_encoding(encoding, 3), args, kwargs
@@ -273,6 +268,8 @@ class Path:
     >>> pass
     """
 
+    __slots__ = ('root', 'at', '__weakref__')
+
     __repr = "{self.__class__.__name__}({self.root.filename!r}, {self.at!r})"
 
     def __init__(self, root, at=""):
@@ -285,9 +282,17 @@ class Path:
         original type, the caller should either create a
         separate ZipFile object or pass a filename.
         """
-        self.root = FastLookup.make(root)
+        self.root = CompleteDirs.make(root)
         self.at = at
 
+    def __getstate__(self):
+        return self.root, self.at, getattr(self, '__dict__', None)
+
+    def __setstate__(self, state):
+        self.root, self.at, attrs = state
+        if attrs:
+            vars(self).update(attrs)
+
     def __eq__(self, other):
         """
         >>> Path(zipfile.ZipFile(io.BytesIO(), 'w')) == 'foo'
@@ -352,9 +357,6 @@ class Path:
         with self.open('rb') as strm:
             return strm.read()
 
-    def _is_child(self, path):
-        return posixpath.dirname(path.at.rstrip("/")) == self.at.rstrip("/")
-
     def _next(self, at):
         return self.__class__(self.root, at)
 
@@ -370,8 +372,8 @@ class Path:
     def iterdir(self):
         if not self.is_dir():
             raise ValueError("Can't listdir a file")
-        subs = map(self._next, self.root.namelist())
-        return filter(self._is_child, subs)
+        children = self.root._children().get(self.at.rstrip("/"), ())
+        return map(self._next, children)
 
     def match(self, path_pattern):
         return pathlib.PurePosixPath(self.at).match(path_pattern)
@@ -388,7 +390,7 @@ class Path:
 
         prefix = re.escape(self.at)
         matches = re.compile(prefix + translate(pattern)).fullmatch
-        return map(self._next, filter(matches, self.root.namelist()))
+        return map(self._next, filter(matches, self.root._names()))
 
     def rglob(self, pattern):
         return self.glob(f'**/{pattern}')